@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -44,6 +45,11 @@ class FilingInfo:
     period_of_report: Optional[datetime] = None
     items: Optional[List[str]] = None
 
+    def __post_init__(self):
+        # Form types repeat across every listing; keep one canonical (uppercased, interned) copy of each
+        if isinstance(self.form_type, str):
+            self.form_type = sys.intern(self.form_type.upper())
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
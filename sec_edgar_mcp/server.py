@@ -2,13 +2,39 @@ import argparse
 import logging
 import os
 import time
+from typing import List
 from fastmcp import FastMCP
 
 from sec_edgar_mcp.tools import CompanyTools, FilingsTools, FinancialTools, InsiderTools, ProxyTools
+from sec_edgar_mcp.utils import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def _json_default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def _serialize_tool_result(data) -> str:
+    """Encode tool results straight to JSON with orjson (falling back to str() for unknown types)."""
+    return orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
 
 
 # Initialize MCP server
-mcp = FastMCP("SEC EDGAR MCP", dependencies=["edgartools", "beautifulsoup4"])
+mcp = FastMCP(
+    "SEC EDGAR MCP",
+    dependencies=["edgartools", "beautifulsoup4"],
+    tool_serializer=_serialize_tool_result if orjson is not None else None,
+)
 
 
 _LOG = logging.getLogger("sec_edgar_mcp.server")
@@ -57,7 +83,7 @@ company_tools = CompanyTools()
 filings_tools = FilingsTools()
 financial_tools = FinancialTools()
 insider_tools = InsiderTools()
-proxy_tools = ProxyTools(filings_tools)
+proxy_tools = ProxyTools(filings_tools, response_cache=ResponseCache.from_env())
 
 
 # Company Tools
@@ -231,7 +257,7 @@ def get_filing_sections(identifier: str, accession_number: str, form_type: str):
 
 
 @mcp.tool("analyze_proxy_def14a")
-def analyze_proxy_def14a(identifier: str, accession_number: str = None):
+def analyze_proxy_def14a(identifier: str, accession_number: str = None, max_section_chars: int = 8000):
     """
     Analyze a company's proxy (DEF 14A/DEFM14A/PRE 14A/PREM14A) and return raw text spans
     for key derivative-screening sections (S-K 404 related-party, independence, committees,
@@ -251,6 +277,8 @@ def analyze_proxy_def14a(identifier: str, accession_number: str = None):
     Args:
         identifier: Ticker or CIK
         accession_number: Optional specific proxy accession to analyze. If omitted, uses the most recent proxy within last 400 days.
+        max_section_chars: Maximum characters of text returned per section (default: 8000, 0 for no limit).
+            Truncated sections end with "…[truncated]" and have section_truncated set.
 
     Returns:
         Dict containing:
@@ -267,7 +295,9 @@ def analyze_proxy_def14a(identifier: str, accession_number: str = None):
         _preview(accession_number),
     )
     try:
-        out = proxy_tools.analyze_proxy_def14a(identifier=identifier, accession_number=accession_number)
+        out = proxy_tools.analyze_proxy_def14a(
+            identifier=identifier, accession_number=accession_number, max_section_chars=max_section_chars
+        )
         _LOG.info(
             "tool_call end   name=analyze_proxy_def14a ok=%s dur_ms=%s",
             out.get("success") if isinstance(out, dict) else None,
@@ -282,6 +312,51 @@ def analyze_proxy_def14a(identifier: str, accession_number: str = None):
         raise
 
 
+@mcp.tool("proxy_cue_glossary")
+def proxy_cue_glossary():
+    """
+    Get the heading cues used to locate each proxy section. analyze_proxy_def14a reports only the
+    section key in sections.*.cue_used; use this to see which headings/phrases that key matches.
+
+    Returns:
+        Dictionary mapping each section key to its list of cue phrases
+    """
+    return proxy_tools.get_cue_glossary()
+
+
+@mcp.tool("analyze_proxies_batch")
+async def analyze_proxies_batch(identifiers: List[str]):
+    """
+    Analyze the most recent proxy (DEF 14A/DEFM14A/PRE 14A/PREM14A) for several companies in one call.
+    Filings are fetched concurrently; each result has the same shape and usage contract as analyze_proxy_def14a.
+
+    Args:
+        identifiers: List of tickers or CIKs (e.g., ["AAPL", "MSFT"])
+
+    Returns:
+        Dict containing:
+          - results: {identifier: analyze_proxy_def14a response}
+          - count
+    """
+    start = time.time()
+    _LOG.info("tool_call start name=analyze_proxies_batch identifiers=%s", _preview(identifiers))
+    try:
+        out = await proxy_tools.analyze_proxies_batch(identifiers)
+        _LOG.info(
+            "tool_call end   name=analyze_proxies_batch ok=%s count=%s dur_ms=%s",
+            out.get("success") if isinstance(out, dict) else None,
+            out.get("count") if isinstance(out, dict) else None,
+            int((time.time() - start) * 1000),
+        )
+        return out
+    except Exception:
+        _LOG.exception(
+            "tool_call error name=analyze_proxies_batch dur_ms=%s",
+            int((time.time() - start) * 1000),
+        )
+        raise
+
+
 # Financial Tools
 @mcp.tool("get_financials")
 def get_financials(identifier: str, statement_type: str = "all"):
@@ -603,11 +678,12 @@ def get_recommended_tools(form_type: str):
             ],
         },
         "DEF 14A": {
-            "tools": ["analyze_proxy_def14a", "get_filing_content", "get_filing_sections"],
+            "tools": ["analyze_proxy_def14a", "analyze_proxies_batch", "get_filing_content", "get_filing_sections"],
             "description": "Proxy statement with executive compensation and governance",
             "tips": [
                 "Look for executive compensation tables",
                 "Review shareholder proposals and board information",
+                "Use analyze_proxies_batch to screen several companies' proxies in one call",
             ],
         },
     }
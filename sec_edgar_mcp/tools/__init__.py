@@ -3,7 +3,7 @@ from .filings import FilingsTools
 from .financial import FinancialTools
 from .insider import InsiderTools
 from .proxy_tools import ProxyTools
-from .types import ToolResponse
+from .types import FilingMeta, ProxySectionResult, ToolResponse
 
 __all__ = [
     "CompanyTools",
@@ -12,4 +12,6 @@ __all__ = [
     "InsiderTools",
     "ProxyTools",
     "ToolResponse",
+    "FilingMeta",
+    "ProxySectionResult",
 ]
@@ -1,11 +1,37 @@
 import logging
-from typing import Dict, Union, List, Optional, Any
+import re
+from typing import Dict, Union, List, Optional, Any, Tuple
 from datetime import datetime, timedelta, date
+from itertools import islice
 from edgar import get_filings
 from ..core.client import EdgarClient
 from ..core.models import FilingInfo
+from ..utils.constants import EIGHT_K_ITEMS
 from ..utils.exceptions import FilingNotFoundError
-from .types import ToolResponse
+from .types import FilingMeta, ToolResponse
+
+_ITEM_PREFIX_RE = re.compile(r"^\s*item\s*", re.IGNORECASE)
+
+
+def _build_filing_info(filing) -> FilingInfo:
+    """Build a FilingInfo from an edgartools filing without touching properties that trigger network fetches."""
+    # Normalize the filing date to a datetime, parsing only when it is not one already
+    filing_date = filing.filing_date
+    if isinstance(filing_date, str):
+        filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
+    elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
+        filing_date = datetime(filing_date.year, filing_date.month, filing_date.day)
+
+    return FilingInfo(
+        accession_number=filing.accession_number,
+        filing_date=filing_date,
+        form_type=filing.form,
+        company_name=filing.company,
+        cik=filing.cik,
+        file_number=None,
+        acceptance_datetime=None,
+        period_of_report=None,
+    )
 
 
 class FilingsTools:
@@ -50,38 +76,12 @@ class FilingsTools:
                 cutoff = None
 
             # Collect up to `limit` results, honoring cutoff if provided
-            filings_list = []
-            for filing in filings:
-
-                # Convert date fields to datetime objects if they're strings
-                filing_date = filing.filing_date
-                if isinstance(filing_date, str):
-                    filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
-                elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                    filing_date = datetime(filing_date.year, filing_date.month, filing_date.day)
-
-                # Avoid accessing properties that may trigger network fetches
-                acceptance_datetime = None
-                period_of_report = None
-
-                # If we have a cutoff, skip filings older than cutoff
-                if cutoff and isinstance(filing_date, datetime) and filing_date < cutoff:
-                    continue
-
-                filing_info = FilingInfo(
-                    accession_number=filing.accession_number,
-                    filing_date=filing_date,
-                    form_type=filing.form,
-                    company_name=filing.company,
-                    cik=filing.cik,
-                    file_number=None,
-                    acceptance_datetime=acceptance_datetime,
-                    period_of_report=period_of_report,
+            infos = (_build_filing_info(filing) for filing in filings)
+            if cutoff:
+                infos = (
+                    info for info in infos if not isinstance(info.filing_date, datetime) or info.filing_date >= cutoff
                 )
-                filings_list.append(filing_info.to_dict())
-
-                if len(filings_list) >= (limit or 50):
-                    break
+            filings_list = [info.to_dict() for info in islice(infos, max(limit or 50, 1))]
 
             out = {"success": True, "filings": filings_list, "count": len(filings_list)}
             self._log.debug(
@@ -94,6 +94,55 @@ class FilingsTools:
             self._log.exception("get_recent_filings error: %s", e)
             return {"success": False, "error": f"Failed to get recent filings: {str(e)}"}
 
+    def _find_filing(self, company, accession_number: str, form: Optional[str] = None):
+        """Resolve a company filing by accession number, or return None if not found."""
+        normalized = accession_number.replace("-", "").strip()
+        if len(normalized) == 18 and normalized.isdigit():
+            # Push the lookup down to edgartools' filings index instead of scanning it in Python
+            dashed = f"{normalized[:10]}-{normalized[10:12]}-{normalized[12:]}"
+            try:
+                matches = company.get_filings(form=form, accession_number=dashed)
+                if matches is None or len(matches) == 0:
+                    return None
+                # edgartools returns the accession match before applying form=, so check the form here,
+                # still accepting amendments as the form-filtered scan does
+                match = matches[0]
+                if form is None or match.form in (form, f"{form}/A"):
+                    return match
+                return None
+            except Exception as e:
+                self._log.debug("_find_filing indexed lookup failed accession=%s: %s", dashed, e)
+
+        # Fallback: linear scan over the company's filings
+        for f in company.get_filings(form=form):
+            if f.accession_number.replace("-", "") == normalized:
+                return f
+        return None
+
+    def _fetch_filing(self, identifier: str, accession_number: str) -> Any:
+        """Resolve a filing for identifier, raising FilingNotFoundError if it does not exist."""
+        company = self.client.get_company(identifier)
+        filing = self._find_filing(company, accession_number)
+        if not filing:
+            raise FilingNotFoundError(f"Filing {accession_number} not found")
+        return filing
+
+    def get_filing_raw(self, identifier: str, accession_number: str) -> Tuple[str, FilingMeta]:
+        """
+        Get the full, untruncated text of a filing and its metadata for internal callers.
+        Unlike get_filing_content, nothing is copied into a response dict and errors are raised, not returned.
+        """
+        filing = self._fetch_filing(identifier, accession_number)
+        # Fall back to the HTML document when there is no plain-text rendering
+        content = filing.text() or filing.html() or ""
+        meta: FilingMeta = {
+            "accession_number": filing.accession_number,
+            "form_type": filing.form.upper(),
+            "filing_date": filing.filing_date.isoformat(),
+            "url": filing.url,
+        }
+        return content, meta
+
     def get_filing_content(self, identifier: str, accession_number: str, max_chars: Optional[int] = 50000) -> ToolResponse:
         """Get the content of a specific filing."""
         try:
@@ -103,19 +152,8 @@ class FilingsTools:
                 accession_number,
                 max_chars,
             )
-            company = self.client.get_company(identifier)
-
-            # Find the specific filing
-            filing = None
-            for f in company.get_filings():
-                if f.accession_number.replace("-", "") == accession_number.replace("-", ""):
-                    filing = f
-                    break
-
-            if not filing:
-                raise FilingNotFoundError(f"Filing {accession_number} not found")
-
-            # Get filing content
+            # Find the specific filing and get its content
+            filing = self._fetch_filing(identifier, accession_number)
             content = filing.text()
 
             # For structured filings, get the data object
@@ -171,11 +209,7 @@ class FilingsTools:
             company = self.client.get_company(identifier)
 
             # Find the specific filing
-            filing = None
-            for f in company.get_filings(form="8-K"):
-                if f.accession_number.replace("-", "") == accession_number.replace("-", ""):
-                    filing = f
-                    break
+            filing = self._find_filing(company, accession_number, form="8-K")
 
             if not filing:
                 raise FilingNotFoundError(f"8-K filing {accession_number} not found")
@@ -183,32 +217,20 @@ class FilingsTools:
             # Get the 8-K object
             eightk = filing.obj()
 
+            # Read the item list once; edgartools reports items as e.g. "Item 2.02"
+            items = list(getattr(eightk, "items", None) or [])
             analysis: Dict[str, Any] = {
                 "date_of_report": datetime.strptime(eightk.date_of_report, "%B %d, %Y").isoformat()
                 if hasattr(eightk, "date_of_report")
                 else None,
-                "items": getattr(eightk, "items", []),
+                "items": items,
                 "events": {},
             }
 
-            # Check for common 8-K items
-            item_descriptions = {
-                "1.01": "Entry into Material Agreement",
-                "1.02": "Termination of Material Agreement",
-                "2.01": "Completion of Acquisition or Disposition",
-                "2.02": "Results of Operations and Financial Condition",
-                "2.03": "Creation of Direct Financial Obligation",
-                "3.01": "Notice of Delisting",
-                "4.01": "Changes in Accountant",
-                "5.01": "Changes in Control",
-                "5.02": "Departure/Election of Directors or Officers",
-                "5.03": "Amendments to Articles/Bylaws",
-                "7.01": "Regulation FD Disclosure",
-                "8.01": "Other Events",
-            }
-
-            for item_code, description in item_descriptions.items():
-                if hasattr(eightk, "has_item") and eightk.has_item(item_code):
+            # Check for common 8-K items with a single set lookup per item code
+            item_codes = {_ITEM_PREFIX_RE.sub("", str(item)).strip().rstrip(".") for item in items}
+            for item_code, description in EIGHT_K_ITEMS.items():
+                if item_code in item_codes:
                     analysis["events"][item_code] = {"present": True, "description": description}
 
             # Check for press releases
@@ -227,11 +249,7 @@ class FilingsTools:
             company = self.client.get_company(identifier)
 
             # Find the filing
-            filing = None
-            for f in company.get_filings(form=form_type):
-                if f.accession_number.replace("-", "") == accession_number.replace("-", ""):
-                    filing = f
-                    break
+            filing = self._find_filing(company, accession_number, form=form_type)
 
             if not filing:
                 raise FilingNotFoundError(f"Filing {accession_number} not found")
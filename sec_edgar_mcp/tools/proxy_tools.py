@@ -1,19 +1,71 @@
+import asyncio
+import bisect
 import datetime
-from typing import Dict, List, Optional, Tuple
+import io
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup
 
+from ..utils.cache import LRUCache, ResponseCache
+from ..utils.exceptions import FilingNotFoundError
+from .types import ProxySectionResult
+
+# Optional faster HTML backends: selectolax (C, fastest), then lxml via BeautifulSoup, then the stdlib parser.
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # pragma: no cover - depends on installed extras
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore[no-redef]
+    except ImportError:
+        HTMLParser = None  # type: ignore[misc]
+
+try:
+    import lxml  # noqa: F401
+
+    _BS4_FEATURES = "lxml"
+except ImportError:  # pragma: no cover - depends on installed extras
+    _BS4_FEATURES = "html.parser"
+
+# Optional Aho-Corasick automaton (pyahocorasick) to match every section cue in a single pass.
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on installed extras
+    ahocorasick = None
 
 # We will reuse the existing FilingsTools instance to stay consistent with the edgartools wiring.
 # FilingsTools must expose:
-#   - get_recent_filings(identifier: str, form_type: Optional[str], days: int, limit: int) -> dict
-#   - get_filing_content(identifier: str, accession_number: str) -> dict
+#   - get_recent_filings(identifier: str, form_type: Optional[Union[str, List[str]]], days: int, limit: int) -> dict
+#   - get_filing_raw(identifier: str, accession_number: str) -> (content, meta), raising on failure
 #
-# The returned dicts should include (or be adapted to include) keys similar to:
+# The returned data should include (or be adapted to include) keys similar to:
 #   filings -> List[{"form_type","accession_number","filing_date","url"}]
-#   content -> {"html" or "text" or "content", "url", "form_type", "accession_number", "filing_date"}
+#   meta    -> {"url", "form_type", "accession_number", "filing_date"}, content being the filing text or HTML
+
+PROXY_FORMS = frozenset(map(sys.intern, ("DEF 14A", "DEFM14A", "PRE 14A", "PREM14A")))
+
+# Preference among proxy forms filed on the same date (lower is preferred)
+PROXY_FORM_RANK = {"DEFM14A": 0, "DEF 14A": 1, "PREM14A": 2, "PRE 14A": 3}
+
+# Recent-filings listings change as new filings land, so keep them only briefly.
+# Parsed proxy documents are keyed by (CIK, accession number); an accepted filing is immutable.
+# Each entry holds a full proxy text (often several MB), so only a handful are kept.
+LISTING_CACHE_TTL_SECONDS = 15 * 60
+DOCUMENT_CACHE_SIZE = 8
+
+# Optional persistent response cache: a given accession's analysis never changes, while the
+# "latest proxy" for a company can, so those entries expire after a day.
+ACCESSION_RESPONSE_TTL_SECONDS = 30 * 86400
+LATEST_RESPONSE_TTL_SECONDS = 86400
 
-PROXY_FORMS = {"DEF 14A", "DEFM14A", "PRE 14A", "PREM14A"}
+# Section spans longer than this are cut and suffixed with TRUNCATION_MARKER (None or <= 0 disables).
+DEFAULT_MAX_SECTION_CHARS = 8000
+TRUNCATION_MARKER = "\n…[truncated]"
+
+# edgartools is blocking, so batch analysis fans out over a small, shared thread pool (kept well under SEC rate limits).
+BATCH_MAX_WORKERS = 4
 
 # Headline cues to carve the proxy into the sections the LLM needs.
 # We do not "interpret" anything; we only surface text spans that likely contain the facts.
@@ -62,81 +114,276 @@ SECTION_CUES = {
 }
 
 
-def _norm(s: str) -> str:
-    return " ".join(s.replace("\xa0", " ").split())
+_LINE_RE = re.compile(r"[^\n]+")
+
+# Published once through the proxy_cue_glossary tool instead of being repeated in every section result.
+PROXY_CUE_GLOSSARY = SECTION_CUES
+
+SECTION_CUES_LOWER = {key: tuple(cue.lower() for cue in cues) for key, cues in SECTION_CUES.items()}
 
 
-def _html_to_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+def _norm(s: str) -> str:
+    # str.split() already splits on all Unicode whitespace (including \xa0), so no replace() pass is needed
+    return " ".join(s.split())
+
+
+def _iter_html_strings(html: str) -> Iterator[str]:
+    """Yield the text nodes of an HTML document in document order, skipping scripts/styles."""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        # Remove scripts/styles
+        for node in tree.css("script, style"):
+            node.decompose()
+        root = tree.body or tree.root
+        if root is None:
+            return
+        for node in root.traverse(include_text=True):
+            if node.tag == "-text" and node.text_content:
+                yield node.text_content
+        return
+
+    soup = BeautifulSoup(html, _BS4_FEATURES)
     # Remove scripts/styles
     for tag in soup(["script", "style"]):
         tag.decompose()
-    text = soup.get_text("\n")
-    return _norm(text)
+    yield from soup.strings
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Split text chunks into normalized, non-empty lines."""
+    for chunk in chunks:
+        for m in _LINE_RE.finditer(chunk):
+            line = _norm(m.group())
+            if line:
+                yield line
 
 
-def _find_all_headings(text: str) -> List[Tuple[int, str]]:
+def _is_heading(line: str) -> bool:
+    """Conservative heading test for a normalized line: short and Title-like."""
+    # Heuristics: many proxy headings are Title Case or ALL CAPS and not ending with punctuation.
+    return 3 <= len(line) <= 120 and (line.isupper() or line.istitle()) and not line.endswith((".", ":", ";", ","))
+
+
+def _build_text_and_headings(lines: Iterable[str]) -> Tuple[str, List[Tuple[int, str]]]:
     """
-    Very light-weight heading finder: collect lines that look like headings.
-    We keep it conservative and simply index lines that are short and Title-like.
+    Join normalized lines into the document text, indexing heading-like lines by offset in the same pass
+    so the text never has to be split back into lines.
     """
+    buf = io.StringIO()
     headings = []
-    lines = text.split("\n")
     offset = 0
     for line in lines:
-        striped = line.strip()
-        if 3 <= len(striped) <= 120:
-            # Heuristics: many proxy headings are Title Case or ALL CAPS and not ending with punctuation.
-            if striped.isupper() or striped.istitle():
-                if not striped.endswith((".", ":", ";", ",")):
-                    headings.append((offset, striped))
-        offset += len(line) + 1
-    # Ensure unique by position
-    headings.sort(key=lambda x: x[0])
-    return headings
-
-
-def _slice_by_cues(text: str, headings: List[Tuple[int, str]], cues: List[str]) -> Optional[str]:
+        if offset:
+            buf.write("\n")
+            offset += 1
+        if _is_heading(line):
+            headings.append((offset, line))
+        buf.write(line)
+        offset += len(line)
+    return buf.getvalue(), headings
+
+
+def _slice_by_cues(
+    text: str,
+    lower_text: str,
+    headings: List[Tuple[int, str]],
+    heading_positions: List[int],
+    cues_lower: Tuple[str, ...],
+) -> Optional[str]:
     """
     Return the text span starting at the first heading that matches any cue and
     ending at the next heading (or end of document).
+    lower_text, the heading titles and cues_lower must already be lowercased;
+    heading_positions are the (sorted) heading offsets.
     """
     if not headings:
         return None
-    lower_text = text.lower()
     # Build list of candidate starts by scanning headings for cue matches
     starts = []
-    for pos, title in headings:
-        title_l = title.lower()
-        for cue in cues:
-            if cue.lower() in title_l:
+    for pos, title_l in headings:
+        for cue in cues_lower:
+            if cue in title_l:
                 starts.append(pos)
                 break
     if not starts:
         # Fallback: raw substring search on full text if a cue phrase appears inline
         first = None
-        for cue in cues:
-            idx = lower_text.find(cue.lower())
+        for cue in cues_lower:
+            idx = lower_text.find(cue)
             if idx != -1:
                 first = idx
                 break
         if first is None:
             return None
-        # Find next heading after this index
-        next_positions = [p for (p, _) in headings if p > first]
-        end = next_positions[0] if next_positions else len(text)
-        return text[first:end].strip()
-
-    start = min(starts)
-    # Determine end by next heading after start
-    after = [p for (p, _) in headings if p > start]
-    end = after[0] if after else len(text)
+        # Span runs to the next heading after this index
+        return _span_after(text, heading_positions, first)
+
+    return _span_after(text, heading_positions, min(starts))
+
+
+def _build_cue_automaton() -> Optional[Any]:
+    """Compile every SECTION_CUES phrase into one automaton; values are (cue_len, [(section, cue_index), ...])."""
+    if ahocorasick is None:
+        return None
+    targets: Dict[str, List[Tuple[str, int]]] = {}
+    for section, cues in SECTION_CUES_LOWER.items():
+        for idx, cue in enumerate(cues):
+            targets.setdefault(cue, []).append((section, idx))
+    automaton = ahocorasick.Automaton()
+    for word, hits in targets.items():
+        automaton.add_word(word, (len(word), hits))
+    automaton.make_automaton()
+    return automaton
+
+
+_CUE_AUTOMATON = _build_cue_automaton()
+
+
+def _span_after(text: str, heading_positions: List[int], start: int) -> str:
+    """Text from start up to the next heading after it (or end of document)."""
+    idx = bisect.bisect_right(heading_positions, start)
+    end = heading_positions[idx] if idx < len(heading_positions) else len(text)
     return text[start:end].strip()
 
 
+def _slice_all_sections(text: str, headings: List[Tuple[int, str]]) -> Dict[str, Optional[str]]:
+    """
+    Slice every SECTION_CUES section out of text. Uses the Aho-Corasick automaton when available so the
+    document is scanned once for all cues; otherwise falls back to _slice_by_cues per section.
+    Both paths follow the same rules: earliest matching heading wins, else the first cue (in cue order)
+    found inline in the text.
+    """
+    if not headings:
+        return {key: None for key in SECTION_CUES}
+
+    # Lowercase the document and headings once for every section
+    lower_text = text.lower()
+    headings_lower = [(p, t.lower()) for p, t in headings]
+    heading_positions = [p for p, _ in headings]
+    if _CUE_AUTOMATON is None:
+        return {
+            key: _slice_by_cues(text, lower_text, headings_lower, heading_positions, cues_lower)
+            for key, cues_lower in SECTION_CUES_LOWER.items()
+        }
+
+    # Earliest heading (headings are sorted by position) matching any cue of each section
+    heading_starts: Dict[str, int] = {}
+    for pos, title_l in headings_lower:
+        for _, (_, hits) in _CUE_AUTOMATON.iter(title_l):
+            for section, _ in hits:
+                heading_starts.setdefault(section, pos)
+
+    # First inline occurrence of each (section, cue), only needed for sections without a matching heading
+    inline_starts: Dict[Tuple[str, int], int] = {}
+    if len(heading_starts) < len(SECTION_CUES):
+        for end_idx, (cue_len, hits) in _CUE_AUTOMATON.iter(lower_text):
+            for hit in hits:
+                inline_starts.setdefault(hit, end_idx - cue_len + 1)
+
+    out: Dict[str, Optional[str]] = {}
+    for key, cues in SECTION_CUES.items():
+        start = heading_starts.get(key)
+        if start is None:
+            start = next((inline_starts[(key, i)] for i in range(len(cues)) if (key, i) in inline_starts), None)
+        out[key] = _span_after(text, heading_positions, start) if start is not None else None
+    return out
+
+
+def _parse_dt(dt_str: Optional[Union[str, datetime.datetime]]) -> Optional[datetime.datetime]:
+    if not dt_str:
+        return None
+    if isinstance(dt_str, datetime.datetime):
+        return dt_str.astimezone(datetime.timezone.utc).replace(tzinfo=None) if dt_str.tzinfo else dt_str
+    try:
+        dt = datetime.datetime.fromisoformat(str(dt_str).replace("Z", "+00:00"))
+        # Normalize to naive UTC for consistent comparisons
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return dt
+    except Exception:
+        return None
+
+
 class ProxyTools:
-    def __init__(self, filings_tools):
+    def __init__(self, filings_tools, response_cache: Optional[ResponseCache] = None):
         self.filings_tools = filings_tools
+        self.response_cache = response_cache
+        self._listing_cache = LRUCache(maxsize=256, ttl=LISTING_CACHE_TTL_SECONDS)
+        self._document_cache = LRUCache(maxsize=DOCUMENT_CACHE_SIZE)
+        # Long-lived so a cancelled batch never waits on executor shutdown inside the event loop
+        self._batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix="proxy-batch")
+
+    def _company_cik(self, identifier: str) -> Optional[str]:
+        """Resolve identifier to a zero-padded CIK, or None if it cannot be resolved."""
+        ident = identifier.strip()
+        if ident.isdigit():
+            return ident.zfill(10)
+        try:
+            cik = self.filings_tools.client.get_cik_by_ticker(ident)
+        except Exception:
+            return None
+        return str(cik).zfill(10) if cik else None
+
+    def _recent_proxy_filings(self, identifier: str, days: int, limit: int) -> List[Dict]:
+        """Recent proxy filings for identifier, cached per (identifier, days)."""
+        key = (identifier.upper(), days)
+        filings = self._listing_cache.get(key)
+        if filings is None:
+            # Push the form filter down to edgartools rather than listing every filing and filtering here
+            recent = self.filings_tools.get_recent_filings(
+                identifier=identifier, form_type=sorted(PROXY_FORMS), days=days, limit=limit
+            )
+            if not isinstance(recent, dict) or not recent.get("success", False):
+                return []
+            filings = recent.get("filings", [])
+            self._listing_cache.set(key, filings)
+        return filings
+
+    def _load_proxy_document(self, identifier: str, accession_number: str) -> Dict:
+        """
+        Fetch and normalize a proxy filing, returning its full text, headings and filing metadata.
+        Results are cached by (CIK, accession number) so repeat calls for the same company skip both
+        EDGAR I/O and HTML parsing, while another company's identifier still goes through get_filing_raw.
+        """
+        cik = self._company_cik(identifier)
+        key = (cik, accession_number.replace("-", "")) if cik else None
+        cached = self._document_cache.get(key) if key else None
+        if cached is not None:
+            return cached
+
+        # Read the raw filing directly rather than through the get_filing_content response dict
+        try:
+            content, meta = self.filings_tools.get_filing_raw(identifier=identifier, accession_number=accession_number)
+        except FilingNotFoundError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            return {"error": f"Failed to get filing content: {str(e)}"}
+
+        if not content:
+            return {"error": "No filing text available."}
+
+        # Heuristic: treat as HTML if it contains angle-bracket tags
+        head = content[:4096].lower()
+        if "<html" in head or "<div" in head or "<p" in head:
+            chunks: Iterable[str] = _iter_html_strings(content)
+        else:
+            chunks = (content,)
+
+        # Stream normalized lines straight into the heading index while building the full text
+        full_text, headings = _build_text_and_headings(_iter_lines(chunks))
+        if not full_text:
+            return {"error": "No filing text available."}
+
+        document = {
+            "full_text": full_text,
+            "headings": headings,
+            "url": meta.get("url"),
+            "form_type": meta.get("form_type"),
+            "filing_date": meta.get("filing_date"),
+        }
+        if key:
+            self._document_cache.set(key, document)
+        return document
 
     def _resolve_proxy_filing(self, identifier: str, accession_number: Optional[str]) -> Dict:
         """
@@ -149,51 +396,28 @@ class ProxyTools:
                 "accession_number": accession_number,
             }
 
-        recent = self.filings_tools.get_recent_filings(
-            identifier=identifier, form_type=None, days=400, limit=200
-        )
-        filings = recent.get("filings", []) if isinstance(recent, dict) else []
-        # Filter to proxy forms
-        proxies = [f for f in filings if str(f.get("form_type", "")).upper() in PROXY_FORMS]
+        filings = self._recent_proxy_filings(identifier, days=400, limit=20)
+        # Filter to proxy forms (the listing may still include amendments such as "DEF 14A/A");
+        # FilingInfo already stores form types uppercased
+        proxies = [f for f in filings if f.get("form_type") in PROXY_FORMS]
         if not proxies:
             return {"error": f"No proxy filings found for {identifier}."}
 
-        # Prefer DEFM14A over DEF 14A, then PREM14A, then PRE 14A, and restrict to ~400 days if possible
-        def _rank(form: str) -> int:
-            form = form.upper()
-            if form == "DEFM14A":
-                return 0
-            if form == "DEF 14A":
-                return 1
-            if form == "PREM14A":
-                return 2
-            if form == "PRE 14A":
-                return 3
-            return 9
-
-        def _parse_dt(dt_str: Optional[str]) -> Optional[datetime.datetime]:
-            if not dt_str:
-                return None
-            try:
-                dt = datetime.datetime.fromisoformat(str(dt_str).replace("Z", "+00:00"))
-                # Normalize to naive UTC for consistent comparisons
-                if dt.tzinfo is not None:
-                    dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
-                return dt
-            except Exception:
-                return None
+        # Parse each filing date once for both the cutoff filter and the selection key
+        dated = [(_parse_dt(p.get("filing_date")), p) for p in proxies]
 
+        # Prefer the most recent filing in the last ~400 days if possible; on date ties prefer
+        # DEFM14A over DEF 14A, then PREM14A, then PRE 14A
         cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=400)
-        proxies_recent = [p for p in proxies if (_parse_dt(p.get("filing_date")) or cutoff) >= cutoff]
-        candidates = proxies_recent if proxies_recent else proxies
+        recent = [(dt, p) for dt, p in dated if (dt or cutoff) >= cutoff]
+        candidates = recent if recent else dated
 
-        def _sort_key(f: Dict) -> tuple:
-            dt = _parse_dt(f.get("filing_date")) or datetime.datetime.min
-            rank = -_rank(str(f.get("form_type", "")))  # larger first -> lower rank preferred
-            return (dt, rank)
+        def _select_key(item: Tuple[Optional[datetime.datetime], Dict]) -> tuple:
+            dt, f = item
+            rank = -PROXY_FORM_RANK.get(f.get("form_type"), 9)  # lower rank preferred
+            return (dt or datetime.datetime.min, rank)
 
-        candidates.sort(key=_sort_key, reverse=True)
-        chosen = candidates[0]
+        chosen = max(candidates, key=_select_key)[1]
         if not chosen.get("accession_number"):
             return {"error": f"Unable to resolve accession number for {identifier}'s proxy filing."}
         return {
@@ -204,7 +428,12 @@ class ProxyTools:
             "url": chosen.get("url"),
         }
 
-    def analyze_proxy_def14a(self, identifier: str, accession_number: Optional[str] = None) -> Dict:
+    def analyze_proxy_def14a(
+        self,
+        identifier: str,
+        accession_number: Optional[str] = None,
+        max_section_chars: Optional[int] = DEFAULT_MAX_SECTION_CHARS,
+    ) -> Dict:
         """
         Fetch the proxy, normalize text, expose key sections as raw spans, and return deterministic metadata.
         This method does not perform legal analysis. It only returns text segments and citations the LLM can use.
@@ -212,9 +441,9 @@ class ProxyTools:
         Returns:
             {
               "success": true,
-              "filing": {"form","accession","date","url","identifier"},
+              "filing": {"form","accession","date","url","identifier","extraction_timestamp_utc","cached"},
               "sections": {
-                 "related_party": {"present": bool, "text": "...", "cue_used": ["..."]},
+                 "related_party": {"present": bool, "text": "...", "section_truncated": bool, "cue_used": "related_party"},
                  "director_independence": {...},
                  "board_committees": {...},
                  "beneficial_ownership": {...},
@@ -226,49 +455,69 @@ class ProxyTools:
               "disclaimer": "All text extracted directly from SEC EDGAR proxy filing; no external sources."
             }
         """
+        # Persistent keys carry the company's CIK so one company's cached proxy is never served for another
+        cik = self._company_cik(identifier) if self.response_cache is not None else None
+        latest_key = None
+        if cik and not accession_number:
+            latest_key = f"proxy:latest:{cik}:{max_section_chars}"
+            cached = self._cached_response(latest_key, identifier)
+            if cached is not None:
+                return cached
+
         selection = self._resolve_proxy_filing(identifier, accession_number)
         if "error" in selection:
             return {"success": False, "error": selection["error"]}
 
         acc_no = selection["accession_number"]
-        content_resp = self.filings_tools.get_filing_content(
-            identifier=identifier, accession_number=acc_no, max_chars=None
-        )
-        if not isinstance(content_resp, dict) or not content_resp.get("success", False):
-            return {"success": False, "error": content_resp.get("error", "Filing fetch failed.") if isinstance(content_resp, dict) else "Filing fetch failed."}
-
-        filing_url = content_resp.get("url")
-        form_type = content_resp.get("form_type", selection.get("form_type", "DEF 14A"))
-        filing_date = content_resp.get("filing_date", selection.get("filing_date"))
-
-        # Support multiple possible keys from FilingsTools: "html", "text", or legacy "content"
-        raw_html = content_resp.get("html")
-        raw_text = content_resp.get("text")
-        if not raw_html and not raw_text:
-            legacy_content = content_resp.get("content")
-            if legacy_content:
-                # Heuristic: treat as HTML if it contains angle-bracket tags
-                if "<html" in legacy_content.lower() or "<div" in legacy_content.lower() or "<p" in legacy_content.lower():
-                    raw_html = legacy_content
-                else:
-                    raw_text = legacy_content
-
-        if raw_html:
-            full_text = _html_to_text(raw_html)
-        elif raw_text:
-            full_text = _norm(raw_text)
-        else:
-            return {"success": False, "error": "No filing text available."}
-
-        headings = _find_all_headings(full_text)
+        accession_key = f"proxy:{cik}:{acc_no.replace('-', '')}:{max_section_chars}" if cik else None
+        result = self._cached_response(accession_key, identifier) if accession_key else None
+        if result is None:
+            result = self._build_proxy_response(identifier, selection, max_section_chars)
+            if accession_key and result.get("success") and self.response_cache is not None:
+                self.response_cache.set(accession_key, result, ACCESSION_RESPONSE_TTL_SECONDS)
+        if latest_key and result.get("success") and self.response_cache is not None:
+            self.response_cache.set(latest_key, result, LATEST_RESPONSE_TTL_SECONDS)
+        return result
+
+    def _cached_response(self, key: str, identifier: str) -> Optional[Dict]:
+        """
+        Look up a cached analysis for key. The key already pins the company's CIK, so the entry is for the
+        same company and only the identifier spelling is updated. The response is flagged as cached;
+        extraction_timestamp_utc keeps the time the sections were originally extracted.
+        """
+        if self.response_cache is None:
+            return None
+        cached = self.response_cache.get(key)
+        if cached is None or not isinstance(cached.get("filing"), dict):
+            return None
+        cached["filing"]["identifier"] = identifier
+        cached["filing"]["cached"] = True
+        return cached
 
-        sections_out = {}
-        for key, cues in SECTION_CUES.items():
-            span = _slice_by_cues(full_text, headings, cues)
+    def _build_proxy_response(self, identifier: str, selection: Dict, max_section_chars: Optional[int]) -> Dict:
+        """Fetch (or reuse) the parsed proxy for selection and assemble the analyze_proxy_def14a response."""
+        acc_no = selection["accession_number"]
+        document = self._load_proxy_document(identifier, acc_no)
+        if "error" in document:
+            return {"success": False, "error": document["error"]}
+
+        filing_url = document.get("url")
+        form_type = document.get("form_type") or selection.get("form_type", "DEF 14A")
+        filing_date = document.get("filing_date") or selection.get("filing_date")
+        full_text = document["full_text"]
+        headings = document["headings"]
+
+        sections_out: Dict[str, ProxySectionResult] = {}
+        for key, span in _slice_all_sections(full_text, headings).items():
+            # Bound each span, like get_filing_content's max_chars, to keep responses reasonable
+            truncated = bool(span) and isinstance(max_section_chars, int) and 0 < max_section_chars < len(span)
+            if truncated:
+                span = span[:max_section_chars] + TRUNCATION_MARKER
             sections_out[key] = {
                 "present": bool(span),
                 "text": span if span else None,
-                "cue_used": cues,
+                "section_truncated": truncated,
+                "cue_used": key,
             }
 
         return {
@@ -280,9 +529,44 @@ class ProxyTools:
                 "url": filing_url,
                 "identifier": identifier,
                 "extraction_timestamp_utc": datetime.datetime.utcnow().isoformat() + "Z",
+                "cached": False,
             },
             "sections": sections_out,
             "full_text_len": len(full_text),
             "headings_index": [{"pos": p, "title": t} for (p, t) in headings],
             "disclaimer": "All text extracted directly from the SEC EDGAR proxy filing; no external sources or interpretations.",
         }
+
+    def get_cue_glossary(self) -> Dict:
+        """Return the heading cues behind each section key reported in analyze_proxy_def14a's "cue_used"."""
+        return {"success": True, "glossary": PROXY_CUE_GLOSSARY}
+
+    async def analyze_proxies_batch(self, identifiers: List[str]) -> Dict:
+        """
+        Run analyze_proxy_def14a for several companies concurrently, so total latency tracks the slowest
+        EDGAR fetch rather than the sum of all of them.
+
+        Returns:
+            {
+              "success": true,
+              "results": {identifier: <analyze_proxy_def14a response>},
+              "count": int
+            }
+        """
+        unique_identifiers = list(dict.fromkeys(i for i in identifiers if i))
+        if not unique_identifiers:
+            return {"success": False, "error": "No identifiers provided."}
+
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self._batch_executor, self.analyze_proxy_def14a, ident) for ident in unique_identifiers
+        ]
+        outcomes = await asyncio.gather(*futures, return_exceptions=True)
+
+        results = {}
+        for ident, outcome in zip(unique_identifiers, outcomes):
+            if isinstance(outcome, BaseException):
+                results[ident] = {"success": False, "error": f"Failed to analyze proxy: {str(outcome)}"}
+            else:
+                results[ident] = outcome
+        return {"success": True, "results": results, "count": len(results)}
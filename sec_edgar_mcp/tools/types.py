@@ -1,6 +1,24 @@
 """Type definitions for tool functions."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TypedDict
 
 # Common return type for all tool functions
 ToolResponse = Dict[str, Any]
+
+
+class FilingMeta(TypedDict):
+    """Filing metadata returned alongside raw content by FilingsTools.get_filing_raw."""
+
+    accession_number: str
+    form_type: str
+    filing_date: str
+    url: str
+
+
+class ProxySectionResult(TypedDict):
+    """One section of an analyze_proxy_def14a response."""
+
+    present: bool
+    text: Optional[str]
+    section_truncated: bool
+    cue_used: str
@@ -1,9 +1,11 @@
-from .cache import TickerCache
+from .cache import LRUCache, ResponseCache, TickerCache
 from .constants import SEC_USER_AGENT
 from .exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError
 
 __all__ = [
     "TickerCache",
+    "LRUCache",
+    "ResponseCache",
     "SEC_USER_AGENT",
     "SECEdgarMCPError",
     "CompanyNotFoundError",
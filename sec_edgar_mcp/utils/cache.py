@@ -1,8 +1,20 @@
+import json
+import logging
 import requests
 import os
-from typing import Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
 from .exceptions import APIError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+_LOG = logging.getLogger("sec_edgar_mcp.utils.cache")
+
 
 class TickerCache:
     """Cache for ticker to CIK mapping."""
@@ -54,3 +66,90 @@ class TickerCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._cache = None
+
+
+class LRUCache:
+    """Bounded, thread-safe in-memory LRU cache with an optional per-entry TTL (in seconds)."""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._data.clear()
+
+
+class ResponseCache:
+    """
+    Persistent cache for JSON-serializable tool responses, backed by Redis or diskcache.
+    Cache failures are logged and treated as misses so they never fail a tool call.
+    """
+
+    def __init__(self, backend: Any, kind: str):
+        self._backend = backend
+        self._kind = kind
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Build a cache from SEC_EDGAR_REDIS_URL or SEC_EDGAR_RESPONSE_CACHE_DIR; None if neither is configured."""
+        redis_url = os.getenv("SEC_EDGAR_REDIS_URL")
+        cache_dir = os.getenv("SEC_EDGAR_RESPONSE_CACHE_DIR")
+        try:
+            if redis_url:
+                import redis
+
+                return cls(redis.Redis.from_url(redis_url), "redis")
+            if cache_dir:
+                import diskcache
+
+                return cls(diskcache.Cache(cache_dir), "disk")
+        except ImportError as e:
+            _LOG.warning("response cache disabled, backend not installed: %s", e)
+        return None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None on a miss or backend error."""
+        try:
+            payload = self._backend.get(key)
+            if payload is None:
+                return None
+            return orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except Exception as e:
+            _LOG.debug("response cache get failed key=%s: %s", key, e)
+            return None
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        try:
+            payload = orjson.dumps(value) if orjson is not None else json.dumps(value).encode()
+            if self._kind == "redis":
+                self._backend.set(key, payload, ex=int(ttl))
+            else:
+                self._backend.set(key, payload, expire=ttl)
+        except Exception as e:
+            _LOG.debug("response cache set failed key=%s: %s", key, e)
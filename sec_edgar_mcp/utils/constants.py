@@ -17,6 +17,22 @@ FILING_TYPES = {
     "SC 13D": "Beneficial ownership report with intent",
 }
 
+# Common 8-K items surfaced by analyze_8k
+EIGHT_K_ITEMS = {
+    "1.01": "Entry into Material Agreement",
+    "1.02": "Termination of Material Agreement",
+    "2.01": "Completion of Acquisition or Disposition",
+    "2.02": "Results of Operations and Financial Condition",
+    "2.03": "Creation of Direct Financial Obligation",
+    "3.01": "Notice of Delisting",
+    "4.01": "Changes in Accountant",
+    "5.01": "Changes in Control",
+    "5.02": "Departure/Election of Directors or Officers",
+    "5.03": "Amendments to Articles/Bylaws",
+    "7.01": "Regulation FD Disclosure",
+    "8.01": "Other Events",
+}
+
 XBRL_NAMESPACES = {
     "dei": "http://xbrl.sec.gov/dei",
     "us-gaap": "http://fasb.org/us-gaap",